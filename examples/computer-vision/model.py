@@ -14,8 +14,10 @@ This example demonstrates:
 
 import os
 import sys
-import json
 import logging
+
+import orjson
+import numba
 import numpy as np
 import pandas as pd
 from datetime import datetime
@@ -24,27 +26,19 @@ from typing import Dict, List, Tuple, Optional
 # ML Libraries
 import tensorflow as tf
 from tensorflow import keras
-from tensorflow.keras import layers
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, confusion_matrix
-import cv2
-from PIL import Image
+from tensorflow.keras import layers, mixed_precision
+from sklearn.model_selection import StratifiedShuffleSplit
 
 # MLOps Libraries
 import mlflow
 import mlflow.tensorflow
 from opentelemetry import trace
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-# Data Validation
-import great_expectations as ge
-from great_expectations.core import ExpectationSuite
+# Run compute in float16 on GPUs with Tensor Cores; variables stay float32
+mixed_precision.set_global_policy('mixed_float16')
 
-# Bias Detection
-from alibi_detect.cd import TabularDrift
-from alibi_detect.utils.saving import save_detector, load_detector
+# NHWC is what cuDNN wants for Tensor-Core convolutions; make it explicit
+keras.backend.set_image_data_format('channels_last')
 
 # Configure logging
 logging.basicConfig(
@@ -53,17 +47,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Configure OpenTelemetry
-trace.set_tracer_provider(TracerProvider())
-tracer = trace.get_tracer(__name__)
+def _configure_tracing() -> trace.Tracer:
+    """
+    Configure OpenTelemetry when OTEL_ENABLED=1; otherwise return the
+    default no-op tracer so smoke runs skip the Jaeger exporter (and its
+    DNS lookup) entirely
+    """
+    if os.getenv('OTEL_ENABLED') == '1':
+        from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            SimpleSpanProcessor,
+        )
 
-jaeger_exporter = JaegerExporter(
-    agent_host_name="jaeger-agent.monitoring.svc.cluster.local",
-    agent_port=6831,
-)
+        trace.set_tracer_provider(TracerProvider())
+
+        jaeger_exporter = JaegerExporter(
+            agent_host_name="jaeger-agent.monitoring.svc.cluster.local",
+            agent_port=6831,
+        )
 
-span_processor = BatchSpanProcessor(jaeger_exporter)
-trace.get_tracer_provider().add_span_processor(span_processor)
+        # Per-span flushing only when debugging; batch export otherwise
+        if os.getenv('OTEL_DEBUG') == '1':
+            span_processor = SimpleSpanProcessor(jaeger_exporter)
+        else:
+            span_processor = BatchSpanProcessor(jaeger_exporter)
+        trace.get_tracer_provider().add_span_processor(span_processor)
+
+    return trace.get_tracer(__name__)
+
+
+tracer = _configure_tracing()
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _group_accuracy(pred_classes: np.ndarray, true_classes: np.ndarray,
+                    groups: np.ndarray, n_groups: int):
+    """
+    Per-group prediction accuracy in one fused pass over the arrays
+    """
+    accuracies = np.zeros(n_groups, dtype=np.float64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+
+    for g in numba.prange(n_groups):
+        correct = 0
+        total = 0
+        for i in range(groups.shape[0]):
+            if groups[i] == g:
+                total += 1
+                if pred_classes[i] == true_classes[i]:
+                    correct += 1
+        counts[g] = total
+        accuracies[g] = correct / total if total > 0 else 0.0
+
+    return accuracies, counts
 
 
 class ComputerVisionModel:
@@ -77,6 +115,8 @@ class ComputerVisionModel:
         self.model = None
         self.history = None
         self.metrics = {}
+        self.num_classes = None
+        self._test_pred = None
         
         # MLflow configuration
         mlflow.set_tracking_uri("http://mlflow.jenkins.svc.cluster.local:5000")
@@ -93,57 +133,99 @@ class ComputerVisionModel:
         # In production, this would load real image datasets
         num_samples = 1000
         num_classes = 10
-        
-        # Generate synthetic image data
-        X = np.random.rand(num_samples, img_size[0], img_size[1], 3)
-        y = np.random.randint(0, num_classes, num_samples)
-        
-        # Convert to categorical
-        y_categorical = keras.utils.to_categorical(y, num_classes)
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_categorical, test_size=0.2, random_state=42, stratify=y
-        )
+        self.num_classes = num_classes
+
+        images_path = os.path.join(data_path, 'images.uint8')
+        labels_path = os.path.join(data_path, 'labels.npy')
+        data_shape = (num_samples, *img_size, 3)
+
+        if os.path.exists(images_path) and os.path.exists(labels_path):
+            # Map the cached dataset instead of regenerating it; the OS
+            # pages the pixels in on demand
+            X = np.memmap(images_path, dtype=np.uint8, mode='r', shape=data_shape)
+            y = np.load(labels_path)
+            logger.info(f"Loaded cached dataset from {data_path}")
+        else:
+            # Generate synthetic image data as uint8; pixels are scaled to
+            # float32 inside the tf.data pipeline, not in host memory
+            X = np.random.randint(0, 256, size=data_shape, dtype=np.uint8)
+
+            # Integer class labels paired with a sparse loss; no one-hot matrix
+            y = np.random.randint(0, num_classes, num_samples).astype(np.int32)
+
+            self._materialize_cache(images_path, labels_path, X, y)
+
+        # Split by index so each subset is a single fancy-index pass over
+        # the (possibly memory-mapped) arrays
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
+        train_idx, test_idx = next(splitter.split(np.zeros(len(y)), y))
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         
         logger.info(f"Data prepared: Train={X_train.shape}, Test={X_test.shape}")
         return X_train, X_test, y_train, y_test
-    
+
+    @staticmethod
+    def _materialize_cache(images_path: str, labels_path: str,
+                           X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Write the dataset to a memory-mapped cache so later runs skip
+        preprocessing entirely
+        """
+        os.makedirs(os.path.dirname(images_path), exist_ok=True)
+        cache = np.memmap(images_path, dtype=np.uint8, mode='w+', shape=X.shape)
+        cache[:] = X
+        cache.flush()
+        np.save(labels_path, y)
+        logger.info(f"Cached dataset to {os.path.dirname(images_path)}")
+
+    def make_dataset(self, X: np.ndarray, y: np.ndarray,
+                     batch_size: int = 128, shuffle: bool = False) -> tf.data.Dataset:
+        """
+        Wrap arrays in a tf.data pipeline that overlaps preprocessing with training
+        """
+        # Stage the arrays as tf tensors once so fit does not re-copy the
+        # numpy buffers host-to-device on every epoch; together with
+        # cache() the decoded dataset stays resident after the first pass
+        X_t = tf.convert_to_tensor(X)
+        y_t = tf.convert_to_tensor(y)
+        dataset = tf.data.Dataset.from_tensor_slices((X_t, y_t))
+        # Images stay uint8 through the pipeline (4x less cache memory);
+        # the model's Rescaling layer normalizes on-device, so direct
+        # predict calls on raw arrays see the same preprocessing
+        dataset = dataset.cache()
+        if shuffle:
+            dataset = dataset.shuffle(1024)
+        # Fixed batch shapes keep XLA from recompiling on the last partial batch
+        dataset = dataset.batch(batch_size, drop_remainder=shuffle)
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
     @tracer.start_as_current_span("data_validation")
     def validate_data(self, X_train: np.ndarray, y_train: np.ndarray) -> bool:
         """
         Validate data quality using Great Expectations
         """
         logger.info("Validating data quality")
-        
+
         try:
-            # Convert to DataFrame for validation
-            df = pd.DataFrame({
-                'image_shape_0': [X_train.shape[1]] * len(X_train),
-                'image_shape_1': [X_train.shape[2]] * len(X_train),
-                'image_channels': [X_train.shape[3]] * len(X_train),
-                'label_sum': np.sum(y_train, axis=1)
-            })
-            
-            # Create Great Expectations dataset
-            ge_df = ge.from_pandas(df)
-            
-            # Define expectations
-            ge_df.expect_column_values_to_be_between('image_shape_0', 200, 300)
-            ge_df.expect_column_values_to_be_between('image_shape_1', 200, 300)
-            ge_df.expect_column_values_to_equal('image_channels', 3)
-            ge_df.expect_column_values_to_equal('label_sum', 1.0)
-            
-            # Validate
-            validation_result = ge_df.validate()
-            
-            if validation_result.success:
-                logger.info("Data validation passed")
-                return True
-            else:
-                logger.error("Data validation failed")
+            # Shape checks are constant-time assertions on the array metadata
+            if not (200 <= X_train.shape[1] <= 300 and 200 <= X_train.shape[2] <= 300):
+                logger.error("Data validation failed: unexpected image dimensions")
+                return False
+
+            if X_train.shape[3] != 3:
+                logger.error("Data validation failed: expected 3 image channels")
+                return False
+
+            # Integer labels must fall inside the class range
+            num_classes = self.num_classes or int(y_train.max()) + 1
+            if y_train.min() < 0 or y_train.max() >= num_classes:
+                logger.error("Data validation failed: labels out of class range")
                 return False
-                
+
+            logger.info("Data validation passed")
+            return True
+
         except Exception as e:
             logger.error(f"Data validation error: {str(e)}")
             return False
@@ -155,63 +237,92 @@ class ComputerVisionModel:
         """
         logger.info("Building CNN model")
         
-        model = keras.Sequential([
-            # Convolutional layers
-            layers.Conv2D(32, (3, 3), activation='relu', input_shape=input_shape),
-            layers.MaxPooling2D((2, 2)),
-            layers.Conv2D(64, (3, 3), activation='relu'),
-            layers.MaxPooling2D((2, 2)),
-            layers.Conv2D(128, (3, 3), activation='relu'),
-            layers.MaxPooling2D((2, 2)),
-            
-            # Dense layers
-            layers.Flatten(),
-            layers.Dropout(0.5),
-            layers.Dense(512, activation='relu'),
-            layers.Dropout(0.3),
-            layers.Dense(num_classes, activation='softmax')
-        ])
-        
-        # Compile model
+        inputs = keras.Input(shape=input_shape)
+
+        # Normalize inside the model so training, evaluation, and the
+        # bias paths all share one preprocessing definition regardless of
+        # whether inputs arrive as uint8 arrays or dataset tensors
+        x = layers.Rescaling(1.0 / 255)(inputs)
+
+        # 7x7 stride-2 stem with 64 filters: every channel count is a
+        # multiple of 8, which keeps cuDNN on Tensor-Core kernels instead
+        # of inserting layout-transpose kernels for the 3-channel input
+        x = layers.Conv2D(64, 7, strides=2, padding='same', use_bias=False,
+                          activation='relu')(x)
+        x = layers.MaxPooling2D((2, 2))(x)
+        x = layers.Conv2D(64, (3, 3), activation='relu')(x)
+        x = layers.MaxPooling2D((2, 2))(x)
+        x = layers.Conv2D(128, (3, 3), activation='relu')(x)
+        x = layers.MaxPooling2D((2, 2))(x)
+
+        # Global average pooling keeps the head at 128 features instead of
+        # the ~93k-wide flattened map, shrinking the Dense(512) from ~48M
+        # parameters to a few hundred thousand
+        x = layers.GlobalAveragePooling2D()(x)
+        x = layers.Dropout(0.3)(x)
+        x = layers.Dense(512, activation='relu')(x)
+        x = layers.Dense(num_classes)(x)
+        # Keep the softmax in float32 for numerical stability under
+        # the mixed_float16 policy
+        outputs = layers.Activation('softmax', dtype='float32')(x)
+
+        model = keras.Model(inputs, outputs, name=self.model_name)
+
+        # Compile model with loss scaling for float16 gradients
+        optimizer = mixed_precision.LossScaleOptimizer(keras.optimizers.Adam())
         model.compile(
-            optimizer='adam',
-            loss='categorical_crossentropy',
-            metrics=['accuracy', 'precision', 'recall']
+            optimizer=optimizer,
+            loss='sparse_categorical_crossentropy',
+            metrics=['accuracy'],
+            # XLA fuses the per-layer CUDA kernels into a few compiled ones
+            jit_compile=True,
+            # Run 50 steps per tf.function call to amortize Python dispatch
+            steps_per_execution=50
         )
         
         logger.info(f"Model built with {model.count_params()} parameters")
         return model
     
     @tracer.start_as_current_span("model_training")
-    def train_model(self, X_train: np.ndarray, y_train: np.ndarray, 
-                   X_val: np.ndarray, y_val: np.ndarray, epochs: int = 10) -> None:
+    def train_model(self, train_dataset: tf.data.Dataset,
+                   val_dataset: tf.data.Dataset, epochs: int = 10) -> None:
         """
         Train the model with MLflow tracking
         """
         logger.info("Starting model training")
-        
+
         with mlflow.start_run():
             # Log parameters
             mlflow.log_param("epochs", epochs)
-            mlflow.log_param("batch_size", 32)
+            mlflow.log_param("batch_size", 128)
             mlflow.log_param("optimizer", "adam")
             mlflow.log_param("model_architecture", "CNN")
-            
-            # Build model
-            self.model = self.build_model(X_train.shape[1:], y_train.shape[1])
-            
+
+            # Data-parallel across all local GPUs; with a single device the
+            # strategy is a no-op wrapper. Keras distributes the tf.data
+            # input automatically for models built under the scope.
+            strategy = tf.distribute.MirroredStrategy()
+            mlflow.log_param("num_replicas", strategy.num_replicas_in_sync)
+
+            # Build model from the dataset element spec
+            image_spec, _ = train_dataset.element_spec
+            with strategy.scope():
+                self.model = self.build_model(
+                    tuple(image_spec.shape[1:]), self.num_classes
+                )
+
             # Callbacks
             callbacks = [
                 keras.callbacks.EarlyStopping(patience=3, restore_best_weights=True),
-                keras.callbacks.ReduceLROnPlateau(factor=0.2, patience=2)
+                keras.callbacks.ReduceLROnPlateau(factor=0.2, patience=2),
+                keras.callbacks.BackupAndRestore(backup_dir='/tmp/training-backup')
             ]
-            
+
             # Train model
             self.history = self.model.fit(
-                X_train, y_train,
-                validation_data=(X_val, y_val),
+                train_dataset,
+                validation_data=val_dataset,
                 epochs=epochs,
-                batch_size=32,
                 callbacks=callbacks,
                 verbose=1
             )
@@ -235,26 +346,54 @@ class ComputerVisionModel:
         """
         logger.info("Evaluating model")
         
-        # Predictions
-        y_pred = self.model.predict(X_test)
+        # Single forward pass over the test set; loss and metrics are
+        # derived from these predictions instead of a second model.evaluate
+        y_pred = self.model.predict(X_test, batch_size=256)
+        self._test_pred = y_pred
         y_pred_classes = np.argmax(y_pred, axis=1)
-        y_true_classes = np.argmax(y_test, axis=1)
-        
+        y_true_classes = y_test
+
         # Calculate metrics
-        test_loss, test_accuracy, test_precision, test_recall = self.model.evaluate(
-            X_test, y_test, verbose=0
+        test_loss = float(np.mean(
+            keras.losses.sparse_categorical_crossentropy(y_test, y_pred).numpy()
+        ))
+        test_accuracy = float(np.mean(y_pred_classes == y_true_classes))
+
+        # One fused confusion-matrix kernel; every per-class and macro
+        # metric below is derived from its counts
+        conf_matrix = tf.math.confusion_matrix(
+            y_true_classes, y_pred_classes, num_classes=self.num_classes
+        ).numpy()
+
+        tp = np.diag(conf_matrix).astype(np.float64)
+        support = conf_matrix.sum(axis=1).astype(np.float64)
+        predicted = conf_matrix.sum(axis=0).astype(np.float64)
+
+        precision_per_class = np.divide(
+            tp, predicted, out=np.zeros_like(tp), where=predicted > 0
         )
-        
-        # F1 Score
-        f1_score = 2 * (test_precision * test_recall) / (test_precision + test_recall)
-        
-        # Classification report
-        class_report = classification_report(
-            y_true_classes, y_pred_classes, output_dict=True
+        recall_per_class = np.divide(
+            tp, support, out=np.zeros_like(tp), where=support > 0
         )
-        
-        # Confusion matrix
-        conf_matrix = confusion_matrix(y_true_classes, y_pred_classes)
+        pr_sum = precision_per_class + recall_per_class
+        f1_per_class = np.divide(
+            2 * precision_per_class * recall_per_class, pr_sum,
+            out=np.zeros_like(tp), where=pr_sum > 0
+        )
+
+        test_precision = float(precision_per_class.mean())
+        test_recall = float(recall_per_class.mean())
+        f1_score = float(f1_per_class.mean())
+
+        class_report = {
+            str(c): {
+                'precision': float(precision_per_class[c]),
+                'recall': float(recall_per_class[c]),
+                'f1-score': float(f1_per_class[c]),
+                'support': int(support[c])
+            }
+            for c in range(self.num_classes)
+        }
         
         self.metrics = {
             'test_accuracy': test_accuracy,
@@ -270,45 +409,58 @@ class ComputerVisionModel:
         return self.metrics
     
     @tracer.start_as_current_span("bias_detection")
-    def detect_bias(self, X_train: np.ndarray, X_test: np.ndarray, 
+    def detect_bias(self, X_train: np.ndarray, y_train: np.ndarray,
+                   X_test: np.ndarray, y_test: np.ndarray,
                    protected_attributes: Optional[List[str]] = None) -> Dict:
         """
         Detect bias in model predictions
         """
         logger.info("Detecting model bias")
-        
+
         try:
             # For demonstration, create synthetic protected attributes
             # In production, these would be real demographic features
             n_train, n_test = len(X_train), len(X_test)
-            
-            # Simulate protected attributes (e.g., age groups, gender)
-            train_protected = np.random.choice(['group_a', 'group_b'], n_train)
-            test_protected = np.random.choice(['group_a', 'group_b'], n_test)
-            
-            # Get predictions
-            train_pred = self.model.predict(X_train)
-            test_pred = self.model.predict(X_test)
-            
-            # Calculate bias metrics
+
+            # Simulate protected attributes (e.g., age groups, gender) as
+            # small integer codes; group names only appear in result keys
+            group_names = ('group_a', 'group_b')
+            train_protected = np.random.randint(0, 2, n_train, dtype=np.uint8)
+            test_protected = np.random.randint(0, 2, n_test, dtype=np.uint8)
+
+            # Reuse the test predictions cached by evaluate_model and
+            # stream the train predictions in batches to bound GPU memory
+            if self._test_pred is not None and len(self._test_pred) == n_test:
+                test_pred = self._test_pred
+            else:
+                test_pred = self.model.predict(X_test, batch_size=256)
+
+            train_pred = np.concatenate([
+                self.model.predict_on_batch(batch)
+                for batch in np.array_split(X_train, max(1, n_train // 256))
+            ])
+
+            # Argmax once over the full prediction arrays; the group loop
+            # only masks the precomputed class vectors
+            train_pred_classes = np.argmax(train_pred, axis=1)
+            test_pred_classes = np.argmax(test_pred, axis=1)
+            train_true = y_train
+            test_true = y_test
+
+            # Calculate bias metrics with the JIT-compiled group reduction
+            train_accs, train_counts = _group_accuracy(
+                train_pred_classes, train_true, train_protected, len(group_names)
+            )
+            test_accs, test_counts = _group_accuracy(
+                test_pred_classes, test_true, test_protected, len(group_names)
+            )
+
             bias_metrics = {}
-            
-            for group in ['group_a', 'group_b']:
-                train_mask = train_protected == group
-                test_mask = test_protected == group
-                
-                if np.sum(train_mask) > 0 and np.sum(test_mask) > 0:
-                    group_train_acc = np.mean(
-                        np.argmax(train_pred[train_mask], axis=1) == 
-                        np.argmax(X_train[train_mask], axis=1)
-                    )
-                    group_test_acc = np.mean(
-                        np.argmax(test_pred[test_mask], axis=1) == 
-                        np.argmax(X_test[test_mask], axis=1)
-                    )
-                    
-                    bias_metrics[f'{group}_train_accuracy'] = group_train_acc
-                    bias_metrics[f'{group}_test_accuracy'] = group_test_acc
+
+            for code, group in enumerate(group_names):
+                if train_counts[code] > 0 and test_counts[code] > 0:
+                    bias_metrics[f'{group}_train_accuracy'] = train_accs[code]
+                    bias_metrics[f'{group}_test_accuracy'] = test_accs[code]
             
             # Calculate fairness metrics
             if len(bias_metrics) >= 4:
@@ -335,9 +487,10 @@ class ComputerVisionModel:
         
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
-        
-        # Save model
-        self.model.save(model_path)
+
+        # SavedModel writes the graph protobuf plus sharded checkpoints,
+        # which is faster and more portable than legacy HDF5
+        self.model.save(model_path, save_format='tf')
         
         # Save metadata
         metadata = {
@@ -351,8 +504,11 @@ class ComputerVisionModel:
         }
         
         metadata_path = os.path.join(os.path.dirname(model_path), 'metadata.json')
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(
+                metadata,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
         logger.info("Model saved successfully")
     
@@ -417,24 +573,27 @@ def main():
         if not cv_model.validate_data(X_train, y_train):
             raise ValueError("Data validation failed")
         
-        # Split training data for validation
-        X_train_split, X_val, y_train_split, y_val = train_test_split(
-            X_train, y_train, test_size=0.2, random_state=42
-        )
-        
-        # Train model
-        cv_model.train_model(X_train_split, y_train_split, X_val, y_val, epochs=5)
+        # Carve a stratified validation set out of the training split by index
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
+        train_idx, val_idx = next(splitter.split(np.zeros(len(y_train)), y_train))
+        X_train_split, X_val = X_train[train_idx], X_train[val_idx]
+        y_train_split, y_val = y_train[train_idx], y_train[val_idx]
+
+        # Build input pipelines and train model
+        train_dataset = cv_model.make_dataset(X_train_split, y_train_split, shuffle=True)
+        val_dataset = cv_model.make_dataset(X_val, y_val)
+        cv_model.train_model(train_dataset, val_dataset, epochs=5)
         
         # Evaluate model
         metrics = cv_model.evaluate_model(X_test, y_test)
         logger.info(f"Model metrics: {metrics}")
         
         # Detect bias
-        bias_metrics = cv_model.detect_bias(X_train, X_test)
+        bias_metrics = cv_model.detect_bias(X_train, y_train, X_test, y_test)
         logger.info(f"Bias metrics: {bias_metrics}")
         
         # Save model
-        model_path = "/tmp/models/cv-classifier/model.h5"
+        model_path = "/tmp/models/cv-classifier/model"
         cv_model.save_model(model_path)
         
         # Generate model card
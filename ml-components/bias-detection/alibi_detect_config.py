@@ -4,19 +4,117 @@ Author: Nguie Angoue Jean Roch Junior
 Email: nguierochjunior@gmail.com
 """
 
+import json
 import logging
+from datetime import datetime, timezone
+
+import numba
 import numpy as np
 import pandas as pd
+from scipy.special import expit
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-import alibi_detect
-from alibi_detect.utils.saving import save_detector, load_detector
-from alibi_detect import bias
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Recommendation strings are built once at import; _generate_recommendations
+# only selects from these tables
+_NO_BIAS_RECOMMENDATION = "✅ No significant bias detected. Continue monitoring."
+
+_METRIC_RECOMMENDATIONS = {
+    "demographic_parity": (
+        "⚠️ Demographic parity violation detected. Consider rebalancing training data "
+        "or applying fairness constraints during training."
+    ),
+    "equalized_odds": (
+        "⚠️ Equalized odds violation detected. Consider post-processing techniques "
+        "to equalize true positive and false positive rates across groups."
+    ),
+    "equal_opportunity": (
+        "⚠️ Equal opportunity violation detected. Focus on equalizing true positive "
+        "rates across protected groups."
+    ),
+    "calibration": (
+        "⚠️ Calibration bias detected. Consider recalibrating model predictions "
+        "separately for each protected group."
+    ),
+}
+
+_GENERAL_RECOMMENDATIONS = (
+    "🔄 Retrain model with fairness-aware algorithms",
+    "📊 Collect more representative training data",
+    "🎯 Apply bias mitigation techniques (preprocessing, in-processing, or post-processing)",
+    "🔍 Conduct regular bias audits with domain experts",
+    "📖 Review model decisions with affected stakeholders",
+)
+
+
+def _reduce_by_group(codes: np.ndarray, n_groups: int,
+                     weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Per-group sums (or counts when weights is None) over integer codes.
+
+    bincount is fastest for the small dense code spaces typical of
+    fairness audits, but its accumulator array scales with the code
+    space; for wide spaces (e.g. joint group x decile codes of a
+    high-cardinality attribute) a stable argsort + add.reduceat performs
+    one cache-friendly linear scan instead.
+    """
+    if codes.size == 0:
+        return np.zeros(n_groups)
+
+    if n_groups <= 256:
+        if weights is None:
+            return np.bincount(codes, minlength=n_groups).astype(np.float64)
+        return np.bincount(codes, weights=weights, minlength=n_groups)
+
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    values = np.ones(codes.shape[0]) if weights is None else weights[order].astype(np.float64)
+
+    # reduceat only at the starts of occupied runs, then scatter into the
+    # dense output; per-group boundaries would need clamping for empty
+    # trailing groups, which truncates the last occupied segment
+    starts = np.flatnonzero(
+        np.concatenate(([True], sorted_codes[1:] != sorted_codes[:-1]))
+    )
+    sums = np.zeros(n_groups)
+    sums[sorted_codes[starts]] = np.add.reduceat(values, starts)
+    return sums
+
+
+@numba.njit(parallel=True, cache=True, fastmath=True)
+def _reduce_groups(pred: np.ndarray, label: np.ndarray,
+                   codes: np.ndarray, n_groups: int):
+    """Per-group confusion sums in one compiled pass, parallel over groups.
+
+    Counting is branchless: group membership is a 0/1 multiplier and the
+    confusion cells come from bitwise AND on the 0/1 arrays, so the inner
+    loop vectorizes without data-dependent branches. FP/FN/TN derive
+    from these four sums by subtraction.
+    """
+    n = np.zeros(n_groups, dtype=np.int64)
+    positives = np.zeros(n_groups, dtype=np.int64)
+    label_pos = np.zeros(n_groups, dtype=np.int64)
+    true_positives = np.zeros(n_groups, dtype=np.int64)
+
+    for g in numba.prange(n_groups):
+        for i in range(codes.shape[0]):
+            member = np.int64(codes[i] == g)
+            p = np.int64(pred[i])
+            l = np.int64(label[i])
+            n[g] += member
+            positives[g] += member * p
+            label_pos[g] += member * l
+            true_positives[g] += member * (p & l)
+
+    return n, positives, label_pos, true_positives
+
 
 class BiasMetric(Enum):
     """Supported bias detection metrics."""
@@ -27,6 +125,32 @@ class BiasMetric(Enum):
     COUNTERFACTUAL_FAIRNESS = "counterfactual_fairness"
 
 
+@dataclass
+class GroupScoreTable:
+    """Structure-of-arrays layout of per-group bias scores.
+
+    Rows are (attribute, group, metric, score) tuples held in parallel
+    arrays; attrs/groups/metrics are the string vocabularies referenced
+    by the code arrays. Thresholding and ranking stay vectorized, e.g.
+    ``np.nonzero(table.scores > threshold)``.
+    """
+    attrs: List[str]
+    groups: List[str]
+    metrics: List[str]
+    attr_codes: np.ndarray
+    group_codes: np.ndarray
+    metric_codes: np.ndarray
+    scores: np.ndarray
+
+    def to_dict(self) -> Dict[str, float]:
+        """String-keyed view for backward-compatible consumers."""
+        return {
+            f"{self.attrs[a]}_{self.groups[g]}_{self.metrics[m]}": float(s)
+            for a, g, m, s in zip(self.attr_codes, self.group_codes,
+                                  self.metric_codes, self.scores)
+        }
+
+
 @dataclass
 class BiasDetectionResult:
     """Result of bias detection analysis."""
@@ -37,6 +161,7 @@ class BiasDetectionResult:
     group_scores: Dict[str, float]
     recommendations: List[str]
     metadata: Dict[str, Any]
+    group_score_table: Optional[GroupScoreTable] = None
 
 
 class MLModelBiasDetector:
@@ -118,42 +243,77 @@ class MLModelBiasDetector:
         self,
         predictions: np.ndarray,
         true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame,
-        prediction_probabilities: Optional[np.ndarray] = None
+        protected_attributes: Optional[pd.DataFrame] = None,
+        prediction_probabilities: Optional[np.ndarray] = None,
+        protected_codes: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
     ) -> BiasDetectionResult:
         """Detect bias in model predictions.
-        
+
         Args:
             predictions: Model predictions (0/1 for binary classification).
-            true_labels: True labels.
+                The reductions are memory-bound, so pass int8 (or bool)
+                arrays to skip the internal narrowing copy entirely.
+            true_labels: True labels (0/1), same dtype guidance as
+                predictions.
             protected_attributes: DataFrame with protected attribute values.
             prediction_probabilities: Model prediction probabilities (optional).
-        
+            protected_codes: Pre-encoded protected attributes as
+                ``{attr: (codes, categories)}`` where codes is an integer
+                array aligned with predictions and categories maps code i
+                to its group name. Streaming callers that encode once can
+                pass this instead of protected_attributes to skip the
+                per-call pandas categorical build.
+
         Returns:
             BiasDetectionResult with comprehensive bias analysis.
         """
         try:
             # Validate inputs
-            self._validate_inputs(predictions, true_labels, protected_attributes)
-            
+            self._validate_inputs(
+                predictions, true_labels, protected_attributes, protected_codes
+            )
+
+            # Prepare the binary arrays once; every reduction below reuses
+            # these views instead of re-deriving masks or casts
+            pred8 = np.ascontiguousarray(predictions, dtype=np.int8)
+            labels8 = np.ascontiguousarray(true_labels, dtype=np.int8)
+
+            # Encode each protected column once; group membership becomes
+            # an int8 code instead of repeated object-dtype comparisons.
+            # Pre-encoded codes are used as-is.
+            if protected_codes is not None:
+                encoded = protected_codes
+            else:
+                encoded = {}
+                for attr in self.protected_attributes:
+                    cat = pd.Categorical(protected_attributes[attr])
+                    encoded[attr] = (cat.codes, np.asarray(cat.categories))
+
+            # One pass over the data per attribute; every metric below
+            # reads from the shared per-group statistics
+            group_stats = self._build_group_stats(
+                pred8, labels8, encoded, prediction_probabilities
+            )
+
             # Compute bias metrics
             metric_scores = {}
-            group_scores = {}
-            
+
             for metric in self.metrics:
                 score = self._compute_bias_metric(
-                    metric, predictions, true_labels, protected_attributes, prediction_probabilities
+                    metric, group_stats, prediction_probabilities is not None
                 )
                 metric_scores[metric.value] = score
-                
-                # Compute group-specific scores
-                group_score = self._compute_group_bias(
-                    metric, predictions, true_labels, protected_attributes
-                )
-                group_scores.update(group_score)
+
+            # Group-specific scores as parallel arrays; the string-keyed
+            # dict is derived from the table for backward compatibility
+            group_score_table = self._build_group_score_table(group_stats)
+            group_scores = group_score_table.to_dict()
             
-            # Calculate overall bias score
-            overall_bias_score = np.mean(list(metric_scores.values()))
+            # Calculate overall bias score without a list->ndarray round-trip
+            overall_bias_score = (
+                sum(metric_scores.values()) / len(metric_scores)
+                if metric_scores else 0.0
+            )
             bias_detected = overall_bias_score > self.threshold
             
             # Generate recommendations
@@ -168,7 +328,7 @@ class MLModelBiasDetector:
                 "protected_attributes": self.protected_attributes,
                 "metrics_computed": [m.value for m in self.metrics],
                 "threshold": self.threshold,
-                "timestamp": pd.Timestamp.now().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
             result = BiasDetectionResult(
@@ -178,7 +338,8 @@ class MLModelBiasDetector:
                 metric_scores=metric_scores,
                 group_scores=group_scores,
                 recommendations=recommendations,
-                metadata=metadata
+                metadata=metadata,
+                group_score_table=group_score_table
             )
             
             logger.info(f"Bias detection completed for {self.model_name}. "
@@ -190,248 +351,259 @@ class MLModelBiasDetector:
             logger.error(f"Bias detection failed for {self.model_name}: {str(e)}")
             raise
     
+    @staticmethod
+    def _is_binary(values: np.ndarray) -> bool:
+        """Check that all values are 0/1 using vectorized reductions.
+
+        For integer/boolean dtypes two min/max reductions replace the
+        hash-based np.isin scan and its N-sized boolean temporary.
+        """
+        if values.size == 0:
+            return False
+
+        if values.dtype.kind in 'iub':
+            return values.min() >= 0 and values.max() <= 1
+
+        # Float inputs must still hold exact 0/1 values
+        return bool(((values == 0) | (values == 1)).all())
+
     def _validate_inputs(
         self,
         predictions: np.ndarray,
         true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame
+        protected_attributes: Optional[pd.DataFrame] = None,
+        protected_codes: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
     ) -> None:
         """Validate input data for bias detection."""
-        if len(predictions) != len(true_labels):
+        n_samples = len(predictions)
+
+        if n_samples != len(true_labels):
             raise ValueError("Predictions and true labels must have same length")
-        
-        if len(predictions) != len(protected_attributes):
-            raise ValueError("Predictions and protected attributes must have same length")
-        
-        for attr in self.protected_attributes:
-            if attr not in protected_attributes.columns:
-                raise ValueError(f"Protected attribute '{attr}' not found in data")
-        
-        if not np.all(np.isin(predictions, [0, 1])):
+
+        if protected_codes is not None:
+            for attr in self.protected_attributes:
+                if attr not in protected_codes:
+                    raise ValueError(f"Protected attribute '{attr}' not found in codes")
+                if len(protected_codes[attr][0]) != n_samples:
+                    raise ValueError(
+                        "Protected codes and predictions must have same length"
+                    )
+        else:
+            if protected_attributes is None:
+                raise ValueError(
+                    "Either protected_attributes or protected_codes is required"
+                )
+
+            if n_samples != len(protected_attributes):
+                raise ValueError("Predictions and protected attributes must have same length")
+
+            for attr in self.protected_attributes:
+                if attr not in protected_attributes.columns:
+                    raise ValueError(f"Protected attribute '{attr}' not found in data")
+
+        if not self._is_binary(predictions):
             raise ValueError("Predictions must be binary (0 or 1)")
-        
-        if not np.all(np.isin(true_labels, [0, 1])):
+
+        if not self._is_binary(true_labels):
             raise ValueError("True labels must be binary (0 or 1)")
     
-    def _compute_bias_metric(
+    def _build_group_stats(
         self,
-        metric: BiasMetric,
         predictions: np.ndarray,
         true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame,
+        encoded: Dict[str, Tuple[np.ndarray, np.ndarray]],
         prediction_probabilities: Optional[np.ndarray] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Compute per-group statistics from categorical codes.
+
+        Returns, per protected attribute, a DataFrame indexed by group with
+        columns n, positive_rate, tpr, fpr and calibration (NaN where a
+        group has no positive/negative labels, or no probabilities were
+        given). Per-group sums are bincount reductions over the int8
+        codes, so all five bias metrics are served by this one pass with
+        no per-group masking. predictions and true_labels are expected as
+        the contiguous int8 arrays prepared once in detect_bias.
+        """
+        stats = {}
+
+        # Decile assignment for calibration, shared across attributes
+        if prediction_probabilities is not None:
+            bins = np.linspace(0, 1, 11)
+            n_bins = len(bins) - 1
+            bin_idx = np.clip(
+                np.digitize(prediction_probabilities, bins) - 1, 0, n_bins - 1
+            )
+
+        for attr, (raw_codes, categories) in encoded.items():
+            codes = np.ascontiguousarray(raw_codes)
+            n_groups = len(categories)
+
+            n, positives, label_pos, true_positives = _reduce_groups(
+                predictions, true_labels, codes, n_groups
+            )
+            false_positives = positives - true_positives
+            label_neg = n - label_pos
+
+            positive_rate = np.divide(
+                positives, n, out=np.full(n_groups, np.nan), where=n > 0
+            )
+            tpr = np.divide(
+                true_positives, label_pos,
+                out=np.full(n_groups, np.nan), where=label_pos > 0
+            )
+            fpr = np.divide(
+                false_positives, label_neg,
+                out=np.full(n_groups, np.nan), where=label_neg > 0
+            )
+
+            # Per-group calibration error via a joint (group, decile) code,
+            # still one bincount pass per statistic. Rows with a NaN
+            # attribute value carry code -1 and are excluded, matching
+            # the kernel's handling above
+            if prediction_probabilities is not None:
+                member = codes >= 0
+                joint = codes[member].astype(np.int64) * n_bins + bin_idx[member]
+                size = n_groups * n_bins
+                cell_n = _reduce_by_group(joint, size).reshape(n_groups, n_bins)
+                cell_probs = _reduce_by_group(
+                    joint, size, prediction_probabilities[member]
+                ).reshape(n_groups, n_bins)
+                cell_labels = _reduce_by_group(
+                    joint, size, true_labels[member]
+                ).reshape(n_groups, n_bins)
+
+                occupied = cell_n > 0
+                cell_error = np.abs(
+                    np.divide(cell_probs, cell_n, out=np.zeros_like(cell_probs),
+                              where=occupied) -
+                    np.divide(cell_labels, cell_n, out=np.zeros_like(cell_labels),
+                              where=occupied)
+                )
+                occupied_bins = occupied.sum(axis=1)
+                calibration = np.divide(
+                    cell_error.sum(axis=1), occupied_bins,
+                    out=np.full(n_groups, np.nan), where=occupied_bins > 0
+                )
+            else:
+                calibration = np.full(n_groups, np.nan)
+
+            stats[attr] = pd.DataFrame(
+                {'n': n, 'positive_rate': positive_rate, 'tpr': tpr, 'fpr': fpr,
+                 'calibration': calibration},
+                index=categories
+            )
+
+        return stats
+
+    @staticmethod
+    def _max_rate_gap(group_stats: Dict[str, pd.DataFrame], column: str) -> float:
+        """Largest max-min spread of a per-group rate across attributes."""
+        max_bias = 0.0
+
+        for agg in group_stats.values():
+            rates = agg[column].dropna()
+            if len(rates) >= 2:
+                max_bias = max(max_bias, float(rates.max() - rates.min()))
+
+        return max_bias
+
+    def _compute_bias_metric(
+        self,
+        metric: BiasMetric,
+        group_stats: Dict[str, pd.DataFrame],
+        have_probabilities: bool
     ) -> float:
-        """Compute specific bias metric."""
-        
+        """Compute specific bias metric from the fused group statistics."""
+
         if metric == BiasMetric.DEMOGRAPHIC_PARITY:
-            return self._demographic_parity(predictions, protected_attributes)
-        
+            return self._demographic_parity(group_stats)
+
         elif metric == BiasMetric.EQUALIZED_ODDS:
-            return self._equalized_odds(predictions, true_labels, protected_attributes)
-        
+            return self._equalized_odds(group_stats)
+
         elif metric == BiasMetric.EQUAL_OPPORTUNITY:
-            return self._equal_opportunity(predictions, true_labels, protected_attributes)
-        
+            return self._equal_opportunity(group_stats)
+
         elif metric == BiasMetric.CALIBRATION:
-            if prediction_probabilities is None:
+            if not have_probabilities:
                 logger.warning("Calibration requires prediction probabilities, skipping")
                 return 0.0
-            return self._calibration(prediction_probabilities, true_labels, protected_attributes)
-        
+            return self._calibration(group_stats)
+
         elif metric == BiasMetric.COUNTERFACTUAL_FAIRNESS:
             # This would require causal inference, simplified here
-            return self._counterfactual_fairness(predictions, protected_attributes)
-        
+            return self._counterfactual_fairness(group_stats)
+
         else:
             raise ValueError(f"Unknown bias metric: {metric}")
-    
-    def _demographic_parity(
-        self,
-        predictions: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> float:
+
+    def _demographic_parity(self, group_stats: Dict[str, pd.DataFrame]) -> float:
         """Compute demographic parity bias score."""
-        max_bias = 0.0
-        
-        for attr in self.protected_attributes:
-            groups = protected_attributes[attr].unique()
-            if len(groups) < 2:
-                continue
-            
-            group_rates = []
-            for group in groups:
-                mask = protected_attributes[attr] == group
-                if np.sum(mask) > 0:
-                    positive_rate = np.mean(predictions[mask])
-                    group_rates.append(positive_rate)
-            
-            if len(group_rates) >= 2:
-                bias_score = max(group_rates) - min(group_rates)
-                max_bias = max(max_bias, bias_score)
-        
-        return max_bias
-    
-    def _equalized_odds(
-        self,
-        predictions: np.ndarray,
-        true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> float:
+        return self._max_rate_gap(group_stats, 'positive_rate')
+
+    def _equalized_odds(self, group_stats: Dict[str, pd.DataFrame]) -> float:
         """Compute equalized odds bias score."""
-        max_bias = 0.0
-        
-        for attr in self.protected_attributes:
-            groups = protected_attributes[attr].unique()
-            if len(groups) < 2:
-                continue
-            
-            tpr_scores = []
-            fpr_scores = []
-            
-            for group in groups:
-                mask = protected_attributes[attr] == group
-                if np.sum(mask) > 0:
-                    group_preds = predictions[mask]
-                    group_labels = true_labels[mask]
-                    
-                    # True Positive Rate
-                    if np.sum(group_labels == 1) > 0:
-                        tpr = np.mean(group_preds[group_labels == 1])
-                        tpr_scores.append(tpr)
-                    
-                    # False Positive Rate
-                    if np.sum(group_labels == 0) > 0:
-                        fpr = np.mean(group_preds[group_labels == 0])
-                        fpr_scores.append(fpr)
-            
-            # Compute bias as max difference in TPR and FPR
-            if len(tpr_scores) >= 2:
-                tpr_bias = max(tpr_scores) - min(tpr_scores)
-                max_bias = max(max_bias, tpr_bias)
-            
-            if len(fpr_scores) >= 2:
-                fpr_bias = max(fpr_scores) - min(fpr_scores)
-                max_bias = max(max_bias, fpr_bias)
-        
-        return max_bias
-    
-    def _equal_opportunity(
-        self,
-        predictions: np.ndarray,
-        true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> float:
+        return max(
+            self._max_rate_gap(group_stats, 'tpr'),
+            self._max_rate_gap(group_stats, 'fpr')
+        )
+
+    def _equal_opportunity(self, group_stats: Dict[str, pd.DataFrame]) -> float:
         """Compute equal opportunity bias score."""
-        max_bias = 0.0
-        
-        for attr in self.protected_attributes:
-            groups = protected_attributes[attr].unique()
-            if len(groups) < 2:
-                continue
-            
-            tpr_scores = []
-            
-            for group in groups:
-                mask = protected_attributes[attr] == group
-                if np.sum(mask) > 0:
-                    group_preds = predictions[mask]
-                    group_labels = true_labels[mask]
-                    
-                    # True Positive Rate for positive class only
-                    if np.sum(group_labels == 1) > 0:
-                        tpr = np.mean(group_preds[group_labels == 1])
-                        tpr_scores.append(tpr)
-            
-            if len(tpr_scores) >= 2:
-                bias_score = max(tpr_scores) - min(tpr_scores)
-                max_bias = max(max_bias, bias_score)
-        
-        return max_bias
+        return self._max_rate_gap(group_stats, 'tpr')
     
-    def _calibration(
-        self,
-        prediction_probabilities: np.ndarray,
-        true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> float:
+    def _calibration(self, group_stats: Dict[str, pd.DataFrame]) -> float:
         """Compute calibration bias score."""
-        max_bias = 0.0
-        
-        # Bin predictions into deciles
-        bins = np.linspace(0, 1, 11)
-        
-        for attr in self.protected_attributes:
-            groups = protected_attributes[attr].unique()
-            if len(groups) < 2:
-                continue
-            
-            group_calibrations = []
-            
-            for group in groups:
-                mask = protected_attributes[attr] == group
-                if np.sum(mask) > 0:
-                    group_probs = prediction_probabilities[mask]
-                    group_labels = true_labels[mask]
-                    
-                    calibration_errors = []
-                    for i in range(len(bins) - 1):
-                        bin_mask = (group_probs >= bins[i]) & (group_probs < bins[i + 1])
-                        if np.sum(bin_mask) > 0:
-                            predicted_prob = np.mean(group_probs[bin_mask])
-                            actual_prob = np.mean(group_labels[bin_mask])
-                            calibration_errors.append(abs(predicted_prob - actual_prob))
-                    
-                    if calibration_errors:
-                        group_calibrations.append(np.mean(calibration_errors))
-            
-            if len(group_calibrations) >= 2:
-                bias_score = max(group_calibrations) - min(group_calibrations)
-                max_bias = max(max_bias, bias_score)
-        
-        return max_bias
+        return self._max_rate_gap(group_stats, 'calibration')
     
-    def _counterfactual_fairness(
-        self,
-        predictions: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> float:
+    def _counterfactual_fairness(self, group_stats: Dict[str, pd.DataFrame]) -> float:
         """Compute counterfactual fairness bias score (simplified)."""
         # This is a simplified version - real counterfactual fairness
         # requires causal inference and counterfactual data generation
-        return self._demographic_parity(predictions, protected_attributes)
-    
-    def _compute_group_bias(
+        return self._demographic_parity(group_stats)
+
+    def _build_group_score_table(
         self,
-        metric: BiasMetric,
-        predictions: np.ndarray,
-        true_labels: np.ndarray,
-        protected_attributes: pd.DataFrame
-    ) -> Dict[str, float]:
-        """Compute bias scores for individual groups."""
-        group_scores = {}
-        
-        for attr in self.protected_attributes:
-            groups = protected_attributes[attr].unique()
-            
-            for group in groups:
-                mask = protected_attributes[attr] == group
-                if np.sum(mask) > 0:
-                    group_key = f"{attr}_{group}_{metric.value}"
-                    
-                    # Compute metric-specific score for this group
-                    if metric == BiasMetric.DEMOGRAPHIC_PARITY:
-                        score = np.mean(predictions[mask])
-                    elif metric in [BiasMetric.EQUALIZED_ODDS, BiasMetric.EQUAL_OPPORTUNITY]:
-                        if np.sum(true_labels[mask] == 1) > 0:
-                            score = np.mean(predictions[mask][true_labels[mask] == 1])
-                        else:
-                            score = 0.0
-                    else:
-                        score = 0.0
-                    
-                    group_scores[group_key] = score
-        
-        return group_scores
+        group_stats: Dict[str, pd.DataFrame]
+    ) -> GroupScoreTable:
+        """Assemble per-group scores as parallel arrays from the stats table."""
+        attrs = list(group_stats.keys())
+        metric_names = [m.value for m in self.metrics]
+
+        groups: List[str] = []
+        attr_codes, group_codes, metric_codes, scores = [], [], [], []
+
+        for attr_id, agg in enumerate(group_stats.values()):
+            base = len(groups)
+            groups.extend(str(group) for group in agg.index)
+            n_groups = len(agg)
+
+            positive_rate = np.nan_to_num(agg['positive_rate'].to_numpy())
+            tpr = np.nan_to_num(agg['tpr'].to_numpy())
+
+            for metric_id, metric in enumerate(self.metrics):
+                if metric == BiasMetric.DEMOGRAPHIC_PARITY:
+                    metric_scores = positive_rate
+                elif metric in [BiasMetric.EQUALIZED_ODDS, BiasMetric.EQUAL_OPPORTUNITY]:
+                    metric_scores = tpr
+                else:
+                    metric_scores = np.zeros(n_groups)
+
+                attr_codes.append(np.full(n_groups, attr_id, dtype=np.int32))
+                group_codes.append(np.arange(base, base + n_groups, dtype=np.int32))
+                metric_codes.append(np.full(n_groups, metric_id, dtype=np.int32))
+                scores.append(metric_scores.astype(np.float64))
+
+        empty = np.empty(0, dtype=np.int32)
+        return GroupScoreTable(
+            attrs=attrs,
+            groups=groups,
+            metrics=metric_names,
+            attr_codes=np.concatenate(attr_codes) if attr_codes else empty,
+            group_codes=np.concatenate(group_codes) if group_codes else empty,
+            metric_codes=np.concatenate(metric_codes) if metric_codes else empty,
+            scores=np.concatenate(scores) if scores else np.empty(0)
+        )
     
     def _generate_recommendations(
         self,
@@ -440,53 +612,25 @@ class MLModelBiasDetector:
         bias_detected: bool
     ) -> List[str]:
         """Generate recommendations based on bias detection results."""
-        recommendations = []
-        
         if not bias_detected:
-            recommendations.append("✅ No significant bias detected. Continue monitoring.")
-            return recommendations
-        
-        # Identify most problematic metrics
-        problematic_metrics = [
-            metric for metric, score in metric_scores.items()
-            if score > self.threshold
+            return [_NO_BIAS_RECOMMENDATION]
+
+        # Select the precomputed text for each metric over threshold
+        metric_recommendations = [
+            _METRIC_RECOMMENDATIONS[metric]
+            for metric, score in metric_scores.items()
+            if score > self.threshold and metric in _METRIC_RECOMMENDATIONS
         ]
-        
-        for metric in problematic_metrics:
-            if metric == "demographic_parity":
-                recommendations.append(
-                    "⚠️ Demographic parity violation detected. Consider rebalancing training data "
-                    "or applying fairness constraints during training."
-                )
-            elif metric == "equalized_odds":
-                recommendations.append(
-                    "⚠️ Equalized odds violation detected. Consider post-processing techniques "
-                    "to equalize true positive and false positive rates across groups."
-                )
-            elif metric == "equal_opportunity":
-                recommendations.append(
-                    "⚠️ Equal opportunity violation detected. Focus on equalizing true positive "
-                    "rates across protected groups."
-                )
-            elif metric == "calibration":
-                recommendations.append(
-                    "⚠️ Calibration bias detected. Consider recalibrating model predictions "
-                    "separately for each protected group."
-                )
-        
-        # General recommendations
-        recommendations.extend([
-            "🔄 Retrain model with fairness-aware algorithms",
-            "📊 Collect more representative training data",
-            "🎯 Apply bias mitigation techniques (preprocessing, in-processing, or post-processing)",
-            "🔍 Conduct regular bias audits with domain experts",
-            "📖 Review model decisions with affected stakeholders"
-        ])
-        
-        return recommendations
+
+        return [*metric_recommendations, *_GENERAL_RECOMMENDATIONS]
     
     def save_detector(self, filepath: str) -> None:
-        """Save bias detector configuration."""
+        """Save bias detector configuration as JSON.
+
+        The configuration is plain strings/floats/lists, so JSON replaces
+        pickle: faster, portable, and no arbitrary-code-execution surface
+        when loading.
+        """
         config = {
             "model_name": self.model_name,
             "protected_attributes": self.protected_attributes,
@@ -494,19 +638,21 @@ class MLModelBiasDetector:
             "metrics": [m.value for m in self.metrics],
             "detectors": self.detectors
         }
-        
-        import pickle
+
         with open(filepath, 'wb') as f:
-            pickle.dump(config, f)
-        
+            if orjson is not None:
+                f.write(orjson.dumps(config))
+            else:
+                f.write(json.dumps(config).encode('utf-8'))
+
         logger.info(f"Bias detector saved to {filepath}")
-    
+
     @classmethod
     def load_detector(cls, filepath: str) -> 'MLModelBiasDetector':
         """Load bias detector from file."""
-        import pickle
         with open(filepath, 'rb') as f:
-            config = pickle.load(f)
+            raw = f.read()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         metrics = [BiasMetric(m) for m in config["metrics"]]
         detector = cls(
@@ -523,26 +669,27 @@ class MLModelBiasDetector:
 
 def create_sample_bias_detection():
     """Create sample bias detection for demonstration."""
-    # Create sample data
-    np.random.seed(42)
+    # Create sample data with the lock-free PCG64 generator
+    rng = np.random.default_rng(42)
     n_samples = 1000
-    
+
     # Features
-    age = np.random.normal(40, 15, n_samples)
-    income = np.random.normal(50000, 20000, n_samples)
-    
+    age = rng.normal(40, 15, n_samples)
+    income = rng.normal(50000, 20000, n_samples)
+
     # Protected attributes
-    gender = np.random.choice(['M', 'F'], n_samples)
-    race = np.random.choice(['White', 'Black', 'Hispanic', 'Asian'], n_samples)
-    
+    gender = rng.choice(['M', 'F'], n_samples)
+    race = rng.choice(['White', 'Black', 'Hispanic', 'Asian'], n_samples)
+
     # Introduce bias: different approval rates by gender
-    base_approval_prob = 1 / (1 + np.exp(-(age * 0.02 + income * 0.00001 - 2)))
+    base_approval_prob = expit(age * 0.02 + income * 0.00001 - 2)
     gender_bias = np.where(gender == 'M', 0.1, -0.1)
     approval_prob = np.clip(base_approval_prob + gender_bias, 0, 1)
-    
-    # Generate predictions and true labels
-    predictions = np.random.binomial(1, approval_prob, n_samples)
-    true_labels = np.random.binomial(1, base_approval_prob, n_samples)  # Unbiased ground truth
+
+    # Generate predictions and true labels: Bernoulli(p) as a uniform
+    # draw against p, which yields int8 directly
+    predictions = (rng.random(n_samples) < approval_prob).astype(np.int8)
+    true_labels = (rng.random(n_samples) < base_approval_prob).astype(np.int8)  # Unbiased ground truth
     
     # Create DataFrames
     protected_df = pd.DataFrame({
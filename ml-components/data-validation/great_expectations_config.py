@@ -5,20 +5,169 @@ Email: nguierochjunior@gmail.com
 """
 
 import os
+import json
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import functools
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+import numba
+import numpy as np
 import pandas as pd
-import great_expectations as gx
-from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.core.expectation_suite import ExpectationSuite
-from great_expectations.data_context import DataContext
-from great_expectations.exceptions import DataContextError
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# great_expectations is a heavy import (marshmallow, jsonschema, and
+# friends); it is loaded lazily so the fast path never pays for it
+if TYPE_CHECKING:
+    from great_expectations.core.expectation_configuration import ExpectationConfiguration
+    from great_expectations.core.expectation_suite import ExpectationSuite
+    from great_expectations.data_context import DataContext
 
 logger = logging.getLogger(__name__)
 
 
+@numba.njit(parallel=True, cache=True)
+def _numeric_column_stats(values, lo, hi):
+    """Single fused pass over a numeric column.
+
+    Accumulates the null count, out-of-range count, sum, and sum of
+    squares in one traversal, so the null, range, mean, and stdev checks
+    share a single read of the column instead of four. Nulls are counted
+    but kept out of the sums so moments match GE's null-skipping
+    mean/stdev expectations. No fastmath: the null count relies on
+    v != v, which fastmath's no-NaN assumption would fold away.
+    """
+    n = values.shape[0]
+    null_count = 0
+    out_of_range = 0
+    total = 0.0
+    total_sq = 0.0
+    for i in numba.prange(n):
+        v = values[i]
+        if v != v:
+            null_count += 1
+        else:
+            out_of_range += np.int64(v < lo) | np.int64(v > hi)
+            total += v
+            total_sq += v * v
+    return null_count, out_of_range, total, total_sq
+
+
+@dataclass
+class CompiledSchema:
+    """Schema checks regrouped by check kind rather than by column.
+
+    Columns sharing a check kind sit together with their bounds packed
+    into aligned arrays, so the fast path can evaluate one kind across
+    all of its columns in a single NumPy pass. Missing bounds are stored
+    as +/-inf so every comparison stays branch-free.
+    """
+    columns: List[str] = field(default_factory=list)
+    not_null_cols: List[str] = field(default_factory=list)
+    between_cols: List[str] = field(default_factory=list)
+    between_lo: np.ndarray = field(default_factory=lambda: np.empty(0))
+    between_hi: np.ndarray = field(default_factory=lambda: np.empty(0))
+    in_set_cols: List[str] = field(default_factory=list)
+    in_set_values: List[frozenset] = field(default_factory=list)
+    in_set_arrays: List[np.ndarray] = field(default_factory=list)
+    in_set_numeric: List[bool] = field(default_factory=list)
+    mean_cols: List[str] = field(default_factory=list)
+    mean_lo: np.ndarray = field(default_factory=lambda: np.empty(0))
+    mean_hi: np.ndarray = field(default_factory=lambda: np.empty(0))
+    std_cols: List[str] = field(default_factory=list)
+    std_lo: np.ndarray = field(default_factory=lambda: np.empty(0))
+    std_hi: np.ndarray = field(default_factory=lambda: np.empty(0))
+    expected_dtypes: Dict[str, str] = field(default_factory=dict)
+    target_col: Optional[str] = None
+    min_class_ratio: Optional[float] = None
+    timestamp_col: Optional[str] = None
+    max_age_days: int = 30
+    check_duplicates: bool = True
+
+
+def _freeze_config(config: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Freeze a column config into a hashable cache key."""
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in config.items()
+    ))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_column_expectations(
+    column: str,
+    frozen_config: Tuple[Tuple[str, Any], ...]
+) -> Tuple["ExpectationConfiguration", ...]:
+    """Build the basic expectations for one column, memoized.
+
+    Suite rebuilds re-walk the schema and reconstruct identical
+    ExpectationConfiguration objects; caching on the frozen config turns
+    repeat builds into dict lookups.
+    """
+    from great_expectations.core.expectation_configuration import ExpectationConfiguration
+
+    config = dict(frozen_config)
+    expectations = [
+        # Expect column to exist
+        ExpectationConfiguration(
+            expectation_type="expect_column_to_exist",
+            kwargs={"column": column}
+        )
+    ]
+
+    # Expect correct data type
+    if "type" in config:
+        expectations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_of_type",
+                kwargs={"column": column, "type_": config["type"]}
+            )
+        )
+
+    # Null value constraints
+    if config.get("nullable", True) is False:
+        expectations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": column}
+            )
+        )
+
+    # Value range constraints
+    if "min_value" in config or "max_value" in config:
+        expectations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": column,
+                    "min_value": config.get("min_value"),
+                    "max_value": config.get("max_value")
+                }
+            )
+        )
+
+    # Categorical value constraints
+    if "allowed_values" in config:
+        expectations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": column,
+                    "value_set": list(config["allowed_values"])
+                }
+            )
+        )
+
+    return tuple(expectations)
+
+
 class MLDataValidator:
     """Data validation using Great Expectations for ML pipelines."""
     
@@ -30,10 +179,28 @@ class MLDataValidator:
                             If None, uses current directory.
         """
         self.context_root_dir = context_root_dir or os.getcwd()
-        self.context = self._initialize_context()
-        
-    def _initialize_context(self) -> DataContext:
+        self._suite_cache: Dict[Tuple[str, str], "ExpectationSuite"] = {}
+        self._compiled_schemas: Dict[str, CompiledSchema] = {}
+        self._suite_digests: Dict[str, str] = {}
+        self._ds_lock = threading.Lock()
+        self._datasources: Dict[str, Any] = {}
+        self._assets: Dict[str, Any] = {}
+        self._checkpoints: Dict[str, Any] = {}
+
+    @functools.cached_property
+    def context(self) -> "DataContext":
+        """Great Expectations context, initialized on first access.
+
+        Deferred so callers that only use the fast or lazy paths never
+        import great_expectations or touch the context store on disk.
+        """
+        return self._initialize_context()
+
+    def _initialize_context(self) -> "DataContext":
         """Initialize or load Great Expectations data context."""
+        import great_expectations as gx
+        from great_expectations.exceptions import DataContextError
+
         try:
             # Try to load existing context
             context = gx.get_context(context_root_dir=self.context_root_dir)
@@ -52,7 +219,7 @@ class MLDataValidator:
         self, 
         suite_name: str,
         data_schema: Dict[str, Any]
-    ) -> ExpectationSuite:
+    ) -> "ExpectationSuite":
         """Create an expectation suite for ML data validation.
         
         Args:
@@ -63,108 +230,85 @@ class MLDataValidator:
         Returns:
             Created expectation suite.
         """
+        # Skip the rebuild entirely when this exact schema was already compiled
+        digest = self._schema_digest(data_schema)
+        self._suite_digests[suite_name] = digest
+        cache_key = (suite_name, digest)
+        cached = self._suite_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Create or get expectation suite
-        try:
+        if suite_name in self.context.list_expectation_suite_names():
             suite = self.context.get_expectation_suite(suite_name)
             logger.info(f"Loaded existing expectation suite: {suite_name}")
-        except:
+        else:
             suite = self.context.create_expectation_suite(suite_name)
             logger.info(f"Created new expectation suite: {suite_name}")
-        
-        # Clear existing expectations
-        suite.expectations = []
-        
-        # Add basic data quality expectations
-        self._add_basic_expectations(suite, data_schema)
-        
-        # Add ML-specific expectations
-        self._add_ml_expectations(suite, data_schema)
-        
-        # Save the suite
+
+        # A persisted suite stamped with the same digest needs no rebuild or save
+        if suite.meta.get("schema_digest") == digest:
+            self._suite_cache[cache_key] = suite
+            return suite
+
+        # Build the full expectation list, then assign it in one shot;
+        # add_expectation runs a duplicate scan per call, which is
+        # quadratic over wide schemas
+        suite.expectations = (
+            self._build_basic_expectations(data_schema)
+            + self._build_ml_expectations(data_schema)
+        )
+
+        # Stamp and save the suite
+        suite.meta["schema_digest"] = digest
         self.context.save_expectation_suite(suite)
-        
+        self._suite_cache[cache_key] = suite
+
         return suite
-    
-    def _add_basic_expectations(
-        self, 
-        suite: ExpectationSuite, 
+
+    @staticmethod
+    def _schema_digest(data_schema: Dict[str, Any]) -> str:
+        """Stable digest of a schema, used to detect unchanged suites."""
+        serialized = json.dumps(data_schema, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+    def _build_basic_expectations(
+        self,
         data_schema: Dict[str, Any]
-    ) -> None:
-        """Add basic data quality expectations."""
-        
-        # Expect table to exist and have rows
-        suite.add_expectation(
+    ) -> List["ExpectationConfiguration"]:
+        """Build basic data quality expectations."""
+        from great_expectations.core.expectation_configuration import ExpectationConfiguration
+
+        expectations = [
+            # Expect table to exist and have rows
             ExpectationConfiguration(
                 expectation_type="expect_table_row_count_to_be_between",
                 kwargs={"min_value": 1, "max_value": None}
             )
-        )
-        
-        # Column existence and types
+        ]
+
+        # Per-column expectations come from the memoized compiler
         for column, config in data_schema.get("columns", {}).items():
-            # Expect column to exist
-            suite.add_expectation(
-                ExpectationConfiguration(
-                    expectation_type="expect_column_to_exist",
-                    kwargs={"column": column}
-                )
+            expectations.extend(
+                _compile_column_expectations(column, _freeze_config(config))
             )
-            
-            # Expect correct data type
-            if "type" in config:
-                suite.add_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_values_to_be_of_type",
-                        kwargs={"column": column, "type_": config["type"]}
-                    )
-                )
-            
-            # Null value constraints
-            if config.get("nullable", True) is False:
-                suite.add_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_values_to_not_be_null",
-                        kwargs={"column": column}
-                    )
-                )
-            
-            # Value range constraints
-            if "min_value" in config or "max_value" in config:
-                suite.add_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_values_to_be_between",
-                        kwargs={
-                            "column": column,
-                            "min_value": config.get("min_value"),
-                            "max_value": config.get("max_value")
-                        }
-                    )
-                )
-            
-            # Categorical value constraints
-            if "allowed_values" in config:
-                suite.add_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_values_to_be_in_set",
-                        kwargs={
-                            "column": column,
-                            "value_set": config["allowed_values"]
-                        }
-                    )
-                )
-    
-    def _add_ml_expectations(
-        self, 
-        suite: ExpectationSuite, 
+
+        return expectations
+
+    def _build_ml_expectations(
+        self,
         data_schema: Dict[str, Any]
-    ) -> None:
-        """Add ML-specific expectations."""
-        
+    ) -> List["ExpectationConfiguration"]:
+        """Build ML-specific expectations."""
+        from great_expectations.core.expectation_configuration import ExpectationConfiguration
+
+        expectations: List["ExpectationConfiguration"] = []
+
         # Feature distribution expectations
         for column, config in data_schema.get("columns", {}).items():
             if config.get("feature_type") == "numerical":
                 # Check for statistical properties
-                suite.add_expectation(
+                expectations.append(
                     ExpectationConfiguration(
                         expectation_type="expect_column_mean_to_be_between",
                         kwargs={
@@ -174,8 +318,8 @@ class MLDataValidator:
                         }
                     )
                 )
-                
-                suite.add_expectation(
+
+                expectations.append(
                     ExpectationConfiguration(
                         expectation_type="expect_column_stdev_to_be_between",
                         kwargs={
@@ -185,17 +329,17 @@ class MLDataValidator:
                         }
                     )
                 )
-        
+
         # Target variable expectations
         target_column = data_schema.get("target_column")
         if target_column:
             target_config = data_schema["columns"][target_column]
-            
+
             # Class distribution for classification
             if target_config.get("task_type") == "classification":
                 expected_classes = target_config.get("expected_classes", [])
                 if expected_classes:
-                    suite.add_expectation(
+                    expectations.append(
                         ExpectationConfiguration(
                             expectation_type="expect_column_values_to_be_in_set",
                             kwargs={
@@ -204,112 +348,627 @@ class MLDataValidator:
                             }
                         )
                     )
-                
-                # Class balance expectations
-                min_class_ratio = target_config.get("min_class_ratio", 0.01)
-                suite.add_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_proportion_of_unique_values_to_be_between",
-                        kwargs={
-                            "column": target_column,
-                            "min_value": min_class_ratio,
-                            "max_value": 1.0
-                        }
-                    )
-                )
-        
+
+                # Class balance is checked by validate_data_fast via the
+                # smallest value_counts share; the proportion-of-unique
+                # expectation formerly used here measured unique/total,
+                # which is not class balance
+
         # Data freshness expectations
         if "timestamp_column" in data_schema:
             timestamp_col = data_schema["timestamp_column"]
             max_age_days = data_schema.get("max_data_age_days", 30)
-            
-            suite.add_expectation(
+
+            # Take the clock reading once so both bounds agree
+            now = pd.Timestamp.now()
+            expectations.append(
                 ExpectationConfiguration(
                     expectation_type="expect_column_max_to_be_between",
                     kwargs={
                         "column": timestamp_col,
-                        "min_value": pd.Timestamp.now() - pd.Timedelta(days=max_age_days),
-                        "max_value": pd.Timestamp.now()
+                        "min_value": now - pd.Timedelta(days=max_age_days),
+                        "max_value": now
                     }
                 )
             )
-        
-        # Duplicate detection
-        if data_schema.get("check_duplicates", True):
-            suite.add_expectation(
-                ExpectationConfiguration(
-                    expectation_type="expect_table_row_count_to_equal_other_table",
-                    kwargs={
-                        "other_table_name": "deduplicated_table"
-                    }
+
+        # Duplicate detection happens in validate_data_fast as a single
+        # DataFrame.duplicated() pass; the other-table row-count
+        # expectation formerly used here referenced a "deduplicated_table"
+        # that never existed
+
+        return expectations
+    
+    @staticmethod
+    def _compile_schema(data_schema: Dict[str, Any]) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Compile the schema into per-column (check, args) lists.
+
+        The fast path dispatches on these compiled checks instead of
+        re-walking the raw schema dict on every validation.
+        """
+        compiled: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+
+        for column, config in data_schema.get("columns", {}).items():
+            checks: List[Tuple[str, Dict[str, Any]]] = []
+
+            if config.get("nullable", True) is False:
+                checks.append(("not_null", {}))
+
+            if "min_value" in config or "max_value" in config:
+                checks.append(("between", {
+                    "min_value": config.get("min_value"),
+                    "max_value": config.get("max_value")
+                }))
+
+            if "allowed_values" in config:
+                checks.append(("in_set", {"value_set": config["allowed_values"]}))
+
+            if config.get("feature_type") == "numerical":
+                checks.append(("mean_between", {
+                    "min_value": config.get("expected_mean_min"),
+                    "max_value": config.get("expected_mean_max")
+                }))
+                checks.append(("std_between", {
+                    "min_value": config.get("expected_std_min"),
+                    "max_value": config.get("expected_std_max")
+                }))
+
+            compiled[column] = checks
+
+        return compiled
+
+    @staticmethod
+    def _compile_schema_soa(data_schema: Dict[str, Any]) -> CompiledSchema:
+        """Compile the schema into per-kind column lists and bound arrays."""
+        compiled = CompiledSchema()
+        between_lo: List[float] = []
+        between_hi: List[float] = []
+        mean_lo: List[float] = []
+        mean_hi: List[float] = []
+        std_lo: List[float] = []
+        std_hi: List[float] = []
+
+        def bound(value: Optional[float], default: float) -> float:
+            return default if value is None else float(value)
+
+        for column, config in data_schema.get("columns", {}).items():
+            compiled.columns.append(column)
+
+            if "type" in config:
+                compiled.expected_dtypes[column] = config["type"]
+
+            if config.get("nullable", True) is False:
+                compiled.not_null_cols.append(column)
+
+            if "min_value" in config or "max_value" in config:
+                compiled.between_cols.append(column)
+                between_lo.append(bound(config.get("min_value"), -np.inf))
+                between_hi.append(bound(config.get("max_value"), np.inf))
+
+            if "allowed_values" in config:
+                # Intern the vocabulary once: a frozenset for scalar
+                # membership and a prepared array for np.isin; numeric
+                # vocabularies are sorted to allow searchsorted lookups
+                allowed = config["allowed_values"]
+                vocab = np.asarray(allowed)
+                numeric = vocab.dtype.kind in "iuf"
+                if numeric:
+                    vocab = np.sort(vocab)
+                compiled.in_set_cols.append(column)
+                compiled.in_set_values.append(frozenset(allowed))
+                compiled.in_set_arrays.append(vocab)
+                compiled.in_set_numeric.append(numeric)
+
+            if config.get("feature_type") == "numerical":
+                compiled.mean_cols.append(column)
+                mean_lo.append(bound(config.get("expected_mean_min"), -np.inf))
+                mean_hi.append(bound(config.get("expected_mean_max"), np.inf))
+                compiled.std_cols.append(column)
+                std_lo.append(bound(config.get("expected_std_min"), -np.inf))
+                std_hi.append(bound(config.get("expected_std_max"), np.inf))
+
+        compiled.between_lo = np.asarray(between_lo)
+        compiled.between_hi = np.asarray(between_hi)
+        compiled.mean_lo = np.asarray(mean_lo)
+        compiled.mean_hi = np.asarray(mean_hi)
+        compiled.std_lo = np.asarray(std_lo)
+        compiled.std_hi = np.asarray(std_hi)
+        compiled.timestamp_col = data_schema.get("timestamp_column")
+        compiled.max_age_days = data_schema.get("max_data_age_days", 30)
+        compiled.check_duplicates = data_schema.get("check_duplicates", True)
+
+        target_column = data_schema.get("target_column")
+        if target_column:
+            target_config = data_schema["columns"][target_column]
+            if target_config.get("task_type") == "classification":
+                compiled.target_col = target_column
+                compiled.min_class_ratio = target_config.get("min_class_ratio", 0.01)
+
+        return compiled
+
+    def _get_compiled_schema(self, data_schema: Dict[str, Any]) -> CompiledSchema:
+        """Return the cached CompiledSchema for this schema, compiling once."""
+        digest = self._schema_digest(data_schema)
+        compiled = self._compiled_schemas.get(digest)
+        if compiled is None:
+            compiled = self._compile_schema_soa(data_schema)
+            self._compiled_schemas[digest] = compiled
+        return compiled
+
+    @staticmethod
+    def _dtype_matches(dtype: Any, expected: str) -> bool:
+        """Loosely match an actual dtype against a schema type name.
+
+        Mirrors expect_column_values_to_be_of_type, which accepts dtype
+        aliases and parent types: "object" admits pandas string columns,
+        any datetime64 resolution satisfies a datetime64 schema entry,
+        and integer/float widths match within their family.
+        """
+        if str(dtype) == expected:
+            return True
+        if expected in ("object", "str", "string"):
+            return (pd.api.types.is_object_dtype(dtype)
+                    or pd.api.types.is_string_dtype(dtype))
+        if expected.startswith("datetime64"):
+            return pd.api.types.is_datetime64_any_dtype(dtype)
+        if expected.startswith(("int", "uint")):
+            return pd.api.types.is_integer_dtype(dtype)
+        if expected.startswith("float"):
+            return pd.api.types.is_float_dtype(dtype)
+        if expected.startswith("bool"):
+            return pd.api.types.is_bool_dtype(dtype)
+        return False
+
+    def validate_data_fast(
+        self,
+        data: pd.DataFrame,
+        data_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate data with vectorized pandas/NumPy checks.
+
+        Runs the schema's null/range/set/mean/std checks directly as
+        C-level reductions instead of routing each one through Great
+        Expectations' per-expectation dispatch. Checks of the same kind
+        are batched across columns, so e.g. every range check runs as a
+        single two-dimensional comparison. Returns the same result shape
+        as validate_data so callers can switch freely.
+
+        Args:
+            data: DataFrame to validate.
+            data_schema: Schema definition as used for suite creation.
+
+        Returns:
+            Validation results dictionary.
+        """
+        compiled = self._get_compiled_schema(data_schema)
+        results = []
+        present = set(data.columns)
+        # Columns that are missing or fail their null check are excluded
+        # from the remaining batched passes
+        skip = set()
+
+        # Mirror the suite's expect_table_row_count_to_be_between(min=1):
+        # an empty frame is a reported failure, and the row-dependent
+        # reductions below guard against zero-size arrays
+        n_rows = len(data)
+        results.append({
+            "column": None, "check": "row_count", "success": n_rows > 0
+        })
+
+        for column in compiled.columns:
+            exists = column in present
+            results.append({"column": column, "check": "exists", "success": exists})
+            if not exists:
+                skip.add(column)
+
+        # Type checks: one dtype snapshot compared against the schema,
+        # instead of a per-column expectation dispatch
+        if compiled.expected_dtypes:
+            actual = dict(data.dtypes.items())
+            for column, expected in compiled.expected_dtypes.items():
+                if column in skip:
+                    continue
+                results.append({
+                    "column": column, "check": "type",
+                    "success": self._dtype_matches(actual[column], expected)
+                })
+
+        # Numeric feature columns take the fused kernel: null scan, range
+        # check, and both moments from one read of the column
+        kernel_stats: Dict[str, Tuple[int, int, float, float]] = {}
+        bounds = dict(zip(
+            compiled.between_cols, zip(compiled.between_lo, compiled.between_hi)
+        ))
+        # The kernel is already parallel via prange, so columns run one
+        # after another; entering it from multiple Python threads is not
+        # safe with numba's default threading layer
+        for column in compiled.mean_cols:
+            if column in skip:
+                continue
+            values = data[column].values
+            if values.dtype.kind not in "if":
+                continue
+            lo, hi = bounds.get(column, (-np.inf, np.inf))
+            null_count, out_of_range, total, total_sq = _numeric_column_stats(
+                np.ascontiguousarray(values), float(lo), float(hi)
+            )
+            # Moments over the non-null values only, matching GE
+            n = len(values) - null_count
+            mean = total / n if n else 0.0
+            var = max(total_sq - total * total / n, 0.0) / (n - 1) if n > 1 else 0.0
+            kernel_stats[column] = (null_count, out_of_range, mean, float(np.sqrt(var)))
+
+        for column in compiled.not_null_cols:
+            if column in skip:
+                continue
+            if column in kernel_stats:
+                success = kernel_stats[column][0] == 0
+            else:
+                success = not pd.isna(data[column].values).any()
+            results.append({"column": column, "check": "not_null", "success": success})
+            if not success:
+                skip.add(column)
+
+        # Range checks: kernel columns already counted violations; the
+        # rest go through one matrix and one comparison kernel
+        for column in compiled.between_cols:
+            if column in skip or column not in kernel_stats:
+                continue
+            results.append({
+                "column": column, "check": "between",
+                "success": kernel_stats[column][1] == 0
+            })
+
+        # Columns whose dtype can't meet a numeric bound are failed
+        # outright; letting them into the matrix would raise a TypeError
+        # on the comparison and lose the whole result set
+        keep = []
+        for i, c in enumerate(compiled.between_cols):
+            if c in skip or c in kernel_stats:
+                continue
+            if data[c].values.dtype.kind in "iufb":
+                keep.append(i)
+            else:
+                results.append({
+                    "column": c, "check": "between", "success": False
+                })
+        if keep:
+            cols = [compiled.between_cols[i] for i in keep]
+            values = data[cols].to_numpy()
+            # Nulls don't fail a range check (GE ignores them; the fused
+            # kernel's negated comparison treats NaN the same way)
+            in_range = (
+                (values >= compiled.between_lo[keep])
+                & (values <= compiled.between_hi[keep])
+            )
+            if values.dtype.kind == "f":
+                in_range |= np.isnan(values)
+            ok = in_range.all(axis=0)
+            for column, success in zip(cols, ok):
+                results.append({
+                    "column": column, "check": "between", "success": bool(success)
+                })
+
+        # Set membership stays per column; vocabularies differ in dtype
+        for column, vocab, numeric in zip(
+            compiled.in_set_cols, compiled.in_set_arrays, compiled.in_set_numeric
+        ):
+            if column in skip:
+                continue
+            values = data[column].values
+            if numeric:
+                # Sorted vocabulary: branchless membership via
+                # searchsorted. Nulls are not violations (GE ignores
+                # them in value_set checks), so drop them first
+                if values.dtype.kind == "f":
+                    values = values[~np.isnan(values)]
+                idx = np.minimum(
+                    np.searchsorted(vocab, values), len(vocab) - 1
                 )
+                success = bool((vocab[idx] == values).all())
+            else:
+                # Object vocabulary: encode against fixed categories and
+                # scan the int8 codes; out-of-set values encode as -1,
+                # as do nulls, so only non-null -1s count as violations
+                codes = pd.Categorical(values, categories=vocab).codes
+                invalid = (codes == -1) & ~pd.isna(values)
+                success = not bool(invalid.any())
+            results.append({"column": column, "check": "in_set", "success": success})
+
+        # Moment checks: kernel columns compare their fused statistics;
+        # the rest take column means and stds from one matrix
+        mean_bounds = dict(zip(
+            compiled.mean_cols, zip(compiled.mean_lo, compiled.mean_hi)
+        ))
+        std_bounds = dict(zip(
+            compiled.std_cols, zip(compiled.std_lo, compiled.std_hi)
+        ))
+        for column, (_, _, mean, std) in kernel_stats.items():
+            if column in skip:
+                continue
+            lo, hi = mean_bounds[column]
+            results.append({
+                "column": column, "check": "mean_between",
+                "success": bool(lo <= mean <= hi)
+            })
+            lo, hi = std_bounds[column]
+            results.append({
+                "column": column, "check": "std_between",
+                "success": bool(lo <= std <= hi)
+            })
+
+        keep = []
+        for i, c in enumerate(compiled.mean_cols):
+            if c in skip or c in kernel_stats:
+                continue
+            if data[c].values.dtype.kind in "iufb":
+                keep.append(i)
+            else:
+                results.append({
+                    "column": c, "check": "mean_between", "success": False
+                })
+                results.append({
+                    "column": c, "check": "std_between", "success": False
+                })
+        if keep:
+            cols = [compiled.mean_cols[i] for i in keep]
+            values = data[cols].to_numpy()
+            # nan-aware reductions: nullable columns keep GE's semantics
+            # of computing moments over the non-null values
+            means = np.nanmean(values, axis=0)
+            stds = np.nanstd(values, axis=0, ddof=1)
+            mean_ok = (
+                (means >= compiled.mean_lo[keep]) & (means <= compiled.mean_hi[keep])
             )
-    
+            std_ok = (
+                (stds >= compiled.std_lo[keep]) & (stds <= compiled.std_hi[keep])
+            )
+            for column, success in zip(cols, mean_ok):
+                results.append({
+                    "column": column, "check": "mean_between", "success": bool(success)
+                })
+            for column, success in zip(cols, std_ok):
+                results.append({
+                    "column": column, "check": "std_between", "success": bool(success)
+                })
+
+        # Class balance: smallest class share from one counting pass
+        target = compiled.target_col
+        if target is not None and target in present and target not in skip:
+            values = data[target].values
+            if values.size and values.dtype.kind in "iu" and values.min() >= 0:
+                counts = np.bincount(values)
+                counts = counts[counts > 0]
+            else:
+                counts = data[target].value_counts(sort=False).to_numpy()
+            ratio = counts.min() / counts.sum() if counts.size else 0.0
+            results.append({
+                "column": target, "check": "min_class_ratio",
+                "success": bool(ratio >= compiled.min_class_ratio)
+            })
+
+        # Freshness: one max() reduction over the timestamp column
+        ts_col = compiled.timestamp_col
+        if ts_col is not None and ts_col in present and ts_col not in skip:
+            if n_rows:
+                now = pd.Timestamp.now()
+                newest = pd.Timestamp(data[ts_col].values.max())
+                success = (
+                    now - pd.Timedelta(days=compiled.max_age_days) <= newest <= now
+                )
+            else:
+                # No rows means no fresh data; max() would raise here
+                success = False
+            results.append({
+                "column": ts_col, "check": "freshness", "success": bool(success)
+            })
+
+        # Duplicates: one hash pass over the rows
+        if compiled.check_duplicates:
+            n_dup = int(data.duplicated(keep="first").sum())
+            results.append({
+                "column": None, "check": "no_duplicates",
+                "success": n_dup == 0, "unexpected_count": n_dup
+            })
+
+        return self._summarize_results(results)
+
+    def validate_data_lazy(
+        self,
+        lazy_frame: "pl.LazyFrame",
+        data_schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate a Polars LazyFrame without materializing it.
+
+        Maps the schema's checks onto Polars expressions and evaluates
+        them all in a single streaming collect, so datasets larger than
+        memory can be validated straight from a scan. Requires polars;
+        raises ImportError when it is not installed.
+
+        Args:
+            lazy_frame: LazyFrame to validate (e.g. from pl.scan_parquet).
+            data_schema: Schema definition as used for suite creation.
+
+        Returns:
+            Validation results dictionary.
+        """
+        if pl is None:
+            raise ImportError("polars is required for validate_data_lazy")
+
+        compiled = self._compile_schema(data_schema)
+        available = set(lazy_frame.columns)
+
+        results = []
+        exprs = []
+        expr_keys = []
+
+        for column, checks in compiled.items():
+            exists = column in available
+            results.append({"column": column, "check": "exists", "success": exists})
+            if not exists:
+                continue
+
+            col = pl.col(column)
+            for check, args in checks:
+                min_value = args.get("min_value")
+                max_value = args.get("max_value")
+
+                if check == "not_null":
+                    expr = ~col.is_null().any()
+                elif check == "between":
+                    expr = pl.lit(True)
+                    if min_value is not None:
+                        expr = expr & (col.min() >= min_value)
+                    if max_value is not None:
+                        expr = expr & (col.max() <= max_value)
+                elif check == "in_set":
+                    expr = col.is_in(list(args["value_set"])).all()
+                elif check in ("mean_between", "std_between"):
+                    stat = col.mean() if check == "mean_between" else col.std()
+                    expr = pl.lit(True)
+                    if min_value is not None:
+                        expr = expr & (stat >= min_value)
+                    if max_value is not None:
+                        expr = expr & (stat <= max_value)
+                else:
+                    continue
+
+                exprs.append(expr.alias(f"{column}::{check}"))
+                expr_keys.append((column, check))
+
+        # One streaming pass evaluates every check
+        if exprs:
+            row = lazy_frame.select(exprs).collect(streaming=True).row(0)
+            for (column, check), success in zip(expr_keys, row):
+                results.append({
+                    "column": column, "check": check, "success": bool(success)
+                })
+
+        return self._summarize_results(results)
+
+    @staticmethod
+    def _summarize_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Roll per-check results up into the validate_data result shape."""
+        evaluated = len(results)
+        successful = sum(r["success"] for r in results)
+        failed = evaluated - successful
+        success_percent = (successful / evaluated * 100) if evaluated else 100.0
+
+        statistics = {
+            "evaluated_expectations": evaluated,
+            "successful_expectations": successful,
+            "unsuccessful_expectations": failed,
+            "success_percent": success_percent
+        }
+
+        return {
+            "success": failed == 0,
+            "statistics": statistics,
+            "results": results,
+            "evaluated_expectations": evaluated,
+            "successful_expectations": successful,
+            "failed_expectations": failed,
+            "success_percentage": success_percent
+        }
+
     def validate_data(
-        self, 
-        data: pd.DataFrame, 
+        self,
+        data: pd.DataFrame,
         suite_name: str,
-        checkpoint_name: Optional[str] = None
+        checkpoint_name: Optional[str] = None,
+        n_failure_cases: int = 10
     ) -> Dict[str, Any]:
         """Validate data against an expectation suite.
-        
+
         Args:
             data: DataFrame to validate.
             suite_name: Name of the expectation suite to use.
             checkpoint_name: Optional checkpoint name for validation.
-        
+            n_failure_cases: Maximum unexpected values/indices kept per
+                            expectation result; counts are preserved.
+
         Returns:
             Validation results dictionary.
         """
-        # Create data source
-        datasource_name = f"pandas_datasource_{suite_name}"
-        
-        try:
-            datasource = self.context.get_datasource(datasource_name)
-        except:
-            datasource = self.context.sources.add_pandas(datasource_name)
-        
-        # Add data asset
-        asset_name = f"data_asset_{suite_name}"
-        try:
-            data_asset = datasource.get_asset(asset_name)
-        except:
-            data_asset = datasource.add_dataframe_asset(asset_name)
-        
+        # Create data source (cached across calls). Named by the schema
+        # digest so every suite built from the same schema shares one
+        # datasource, and registered under a lock so concurrent
+        # validations don't race each other into duplicate add_pandas
+        # registrations
+        digest = self._suite_digests.get(suite_name)
+        if digest is None:
+            digest = hashlib.blake2b(suite_name.encode(), digest_size=16).hexdigest()
+        datasource_name = f"pd_ds_{digest[:12]}"
+
+        with self._ds_lock:
+            datasource = self._datasources.get(datasource_name)
+            if datasource is None:
+                if datasource_name in self.context.datasources:
+                    datasource = self.context.get_datasource(datasource_name)
+                else:
+                    datasource = self.context.sources.add_pandas(datasource_name)
+                self._datasources[datasource_name] = datasource
+
+            # Add data asset (cached across calls)
+            asset_name = f"data_asset_{suite_name}"
+            data_asset = self._assets.get(asset_name)
+            if data_asset is None:
+                try:
+                    data_asset = datasource.get_asset(asset_name)
+                except LookupError:
+                    data_asset = datasource.add_dataframe_asset(asset_name)
+                self._assets[asset_name] = data_asset
+
         # Create batch request
         batch_request = data_asset.build_batch_request(dataframe=data)
-        
-        # Create or get checkpoint
+
+        # Create or get checkpoint (cached across calls)
         if checkpoint_name is None:
             checkpoint_name = f"checkpoint_{suite_name}"
-        
-        try:
-            checkpoint = self.context.get_checkpoint(checkpoint_name)
-        except:
-            checkpoint = self.context.add_checkpoint(
-                name=checkpoint_name,
-                validations=[
-                    {
-                        "batch_request": batch_request,
-                        "expectation_suite_name": suite_name
-                    }
-                ]
-            )
-        
+
+        checkpoint = self._checkpoints.get(checkpoint_name)
+        if checkpoint is None:
+            if checkpoint_name in self.context.list_checkpoints():
+                checkpoint = self.context.get_checkpoint(checkpoint_name)
+            else:
+                checkpoint = self.context.add_checkpoint(
+                    name=checkpoint_name,
+                    validations=[
+                        {
+                            "batch_request": batch_request,
+                            "expectation_suite_name": suite_name
+                        }
+                    ]
+                )
+            self._checkpoints[checkpoint_name] = checkpoint
+
         # Run validation
         results = checkpoint.run()
         
         # Extract validation results
         validation_result = results.list_validation_results()[0]
-        
+
+        # Truncate per-expectation failure samples; a badly failing column
+        # can otherwise drag thousands of unexpected values into the result
+        # payload that gets serialized and shipped around
+        for result in validation_result.results:
+            detail = result.result or {}
+            for key in ("partial_unexpected_list", "unexpected_index_list",
+                        "partial_unexpected_index_list"):
+                if key in detail and len(detail[key]) > n_failure_cases:
+                    detail[key] = detail[key][:n_failure_cases]
+
+        # One attribute read; repeated access can proxy through a model
+        stats = validation_result.statistics
+
         return {
             "success": validation_result.success,
-            "statistics": validation_result.statistics,
+            "statistics": stats,
             "results": validation_result.results,
-            "evaluated_expectations": len(validation_result.results),
-            "successful_expectations": validation_result.statistics["successful_expectations"],
-            "failed_expectations": validation_result.statistics["unsuccessful_expectations"],
-            "success_percentage": validation_result.statistics["success_percent"]
+            "evaluated_expectations": stats["evaluated_expectations"],
+            "successful_expectations": stats["successful_expectations"],
+            "failed_expectations": stats["unsuccessful_expectations"],
+            "success_percentage": stats["success_percent"]
         }
     
     def generate_data_docs(self) -> str: